@@ -1,22 +1,312 @@
 import asyncio
-import json
+import os
+import sys
 from datetime import datetime
 from spade.agent import Agent
-from spade.behaviour import CyclicBehaviour
+from spade.behaviour import CyclicBehaviour, PeriodicBehaviour
 from spade.message import Message
 from spade.template import Template
 
+try:
+    import orjson
+
+    def _dumps(payload):
+        """
+        Serialize a message body; orjson encodes datetime values natively.
+        """
+        return orjson.dumps(payload).decode()
+
+    _loads = orjson.loads
+    _DecodeError = orjson.JSONDecodeError  # Also raised for a missing (None) body
+except ImportError:
+    import json
+
+    def _dumps(payload):
+        """
+        Serialize a message body with the standard library encoder,
+        using the same compact separators as orjson.
+        """
+        return json.dumps(payload, separators=(",", ":"), default=datetime.isoformat)
+
+    _loads = json.loads
+    _DecodeError = (json.JSONDecodeError, TypeError)
+
 class Performative:
     """
     FIPA-ACL message performatives for agent communication.
+    Interned so that lookups with an interned incoming value match by identity.
+    """
+    INFORM = sys.intern("inform")           # Share information
+    REQUEST = sys.intern("request")         # Request action or information
+    PROPOSE = sys.intern("propose")         # Propose an action
+    ACCEPT = sys.intern("accept-proposal")  # Accept a proposal
+    REFUSE = sys.intern("refuse")          # Refuse a request
+    AGREE = sys.intern("agree")            # Agree to perform action
+    CONFIRM = sys.intern("confirm")        # Confirm truth of statement
+
+
+# ADDRESSING AND STATIC CONTENT
+
+COORDINATOR_JID = "coordinator@404.city"
+FIELD_AGENTS = ("fieldagent1", "fieldagent2")  # Field agents polled by the coordinator
+FIELD_POOL_NAME = "fieldpool"
+DISASTER_TYPES = ("Fire", "Flood", "Earthquake", "Building Collapse")
+ZONES = tuple(f"Zone-{i}" for i in range(10))
+
+# Pre-encoded JSON fragments for the hottest message types; only the timestamp is spliced in
+_STATUS_REQUEST_PREFIX = '{"request":"status_update","timestamp":"'
+_JSON_STRING_END = '"}'
+
+_EVENTS_PREFIX = '{"events":['
+_EVENTS_SUFFIX = ']}'
+
+
+def _inform_body(events):
+    """
+    Combine encoded INFORM events into one message body; a lone event is sent as-is.
+    """
+    if len(events) == 1:
+        return events[0]
+    return _EVENTS_PREFIX + ",".join(events) + _EVENTS_SUFFIX
+
+
+STATUS_REQUEST_INTERVAL = 8.0   # Seconds between coordinator status polls
+STATUS_INFORM_INTERVAL = 8.0    # Seconds between unsolicited field agent status updates
+DISASTER_REPORT_INTERVAL = 10.0  # Seconds between simulated disaster detections
+STATUS_BASELINE_EVERY = 10      # Full status sent every N updates; the rest are deltas
+
+
+# CONSOLE OUTPUT
+
+_out_buffer = []  # Console lines waiting for the next flush
+
+
+def _emit(text=""):
+    """
+    Queue a console line; message handlers use this instead of print().
+    """
+    _out_buffer.append(text)
+
+
+def _flush_output():
+    """
+    Write all queued console lines with a single call.
     """
-    INFORM = "inform"           # Share information
-    REQUEST = "request"         # Request action or information
-    PROPOSE = "propose"         # Propose an action
-    ACCEPT = "accept-proposal"  # Accept a proposal
-    REFUSE = "refuse"          # Refuse a request
-    AGREE = "agree"            # Agree to perform action
-    CONFIRM = "confirm"        # Confirm truth of statement
+    if _out_buffer:
+        _out_buffer.append("")
+        sys.stdout.write("\n".join(_out_buffer))
+        sys.stdout.flush()
+        _out_buffer.clear()
+
+
+# LOG BUFFERING
+
+LOG_FLUSH_PERIOD = 5         # Seconds between console flushes, and at most one fdatasync of the log
+LOG_BATCH_SIZE = 64          # Most queued entries written per batch (keeps writev under IOV_MAX)
+LOG_BATCH_DELAY = 0.1        # Seconds the writer waits after a short batch so more entries can queue up
+
+_SEP = "=" * 70
+_SUBSEP = "-" * 70
+
+# Static framing of every log entry, encoded once
+_LOG_HEAD = f"\n{_SEP}\n".encode()
+_LOG_TAIL = f"{_SEP}\n".encode()
+
+
+def _drain(queue, limit=None):
+    """
+    Take up to limit entries (all if None) from a queue without waiting.
+    """
+    entries = []
+    while not queue.empty() and (limit is None or len(entries) < limit):
+        entries.append(queue.get_nowait())
+    return entries
+
+
+def _open_log(path):
+    """
+    Open a log file as a raw append-only descriptor.
+    """
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _write_chunks(log_fd, chunks):
+    """
+    Write a list of byte chunks with a single gather-write where the platform has one.
+    """
+    if not chunks:
+        return
+    if hasattr(os, "writev"):
+        written = os.writev(log_fd, chunks)
+        data = None
+    else:
+        data = b"".join(chunks)
+        written = os.write(log_fd, data)
+    
+    total = sum(map(len, chunks))
+    if written < total:
+        # Short write: push out whatever the kernel did not take
+        data = memoryview(data or b"".join(chunks))[written:]
+        while data:
+            data = data[os.write(log_fd, data):]
+
+
+_sync_log = getattr(os, "fdatasync", os.fsync)  # fdatasync skips metadata-only updates
+
+
+class ConsoleFlushBehaviour(PeriodicBehaviour):
+    """
+    Periodically writes out queued console output.
+    """
+    async def run(self):
+        _flush_output()
+
+
+class LogWriterBehaviour(CyclicBehaviour):
+    """
+    Drains an agent's log queue and writes the queued entries in batches,
+    so logging callers never touch the file themselves.
+    The writer is the only user of the descriptor: it syncs it to disk at most once per
+    LOG_FLUSH_PERIOD (and only after new writes), and closes it once the agent's other
+    behaviours have ended.
+    """
+    def __init__(self, log_queue, log_fd):
+        super().__init__()
+        self.log_queue = log_queue
+        self.log_fd = log_fd
+        self._dirty = False  # Written since the last sync
+        self._next_sync = 0.0
+    
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        
+        # Wake up periodically even when idle so a kill() is noticed and pending syncs happen
+        try:
+            first = await asyncio.wait_for(self.log_queue.get(), timeout=LOG_FLUSH_PERIOD)
+        except asyncio.TimeoutError:
+            first = None
+        
+        entries = []
+        if first is not None:
+            entries = [first] + _drain(self.log_queue, LOG_BATCH_SIZE - 1)
+            chunks = [chunk for entry in entries for chunk in entry]
+            await loop.run_in_executor(None, _write_chunks, self.log_fd, chunks)
+            self._dirty = True
+        
+        if self._dirty and loop.time() >= self._next_sync:
+            await loop.run_in_executor(None, _sync_log, self.log_fd)
+            self._dirty = False
+            self._next_sync = loop.time() + LOG_FLUSH_PERIOD
+        
+        # A full batch means entries are arriving faster than one batch per delay: keep writing
+        if 0 < len(entries) < LOG_BATCH_SIZE:
+            await asyncio.sleep(LOG_BATCH_DELAY)
+    
+    async def on_end(self):
+        # Killed behaviours finish their current step before exiting; wait for them so
+        # nothing can queue an entry or touch the descriptor after it is closed
+        for behaviour in list(self.agent.behaviours):
+            if behaviour is not self:
+                await behaviour.join()
+        
+        # Write what is left in LOG_BATCH_SIZE batches so no single writev exceeds IOV_MAX
+        loop = asyncio.get_running_loop()
+        while not self.log_queue.empty():
+            entries = _drain(self.log_queue, LOG_BATCH_SIZE)
+            chunks = [chunk for entry in entries for chunk in entry]
+            await loop.run_in_executor(None, _write_chunks, self.log_fd, chunks)
+            self._dirty = True
+        if self._dirty:
+            os.fsync(self.log_fd)
+        os.close(self.log_fd)
+
+
+def _start_logging(agent, log_file):
+    """
+    Open an agent's log file and add the behaviours that write it and flush the console.
+    Returns the queue the agent's own behaviours log into.
+    """
+    agent.log_fd = _open_log(log_file)
+    agent.log_queue = asyncio.Queue()
+    agent.log_writer = LogWriterBehaviour(log_queue=agent.log_queue, log_fd=agent.log_fd)
+    agent.add_behaviour(agent.log_writer)
+    agent.add_behaviour(ConsoleFlushBehaviour(period=LOG_FLUSH_PERIOD))
+    return agent.log_queue
+
+
+# ACL MESSAGING
+
+class ACLBehaviour(CyclicBehaviour):
+    """
+    Base behaviour for agents exchanging FIPA-ACL messages.
+    Parses incoming messages, dispatches them through self._handlers by performative
+    and queues log entries for the agent's LogWriterBehaviour.
+    """
+    log_agent = None  # Name on the "Agent:" line of log entries (line omitted when None)
+    echo_log = False  # Also print log entries to the console
+    
+    def __init__(self, log_queue):
+        super().__init__()
+        self.log_queue = log_queue
+        self._sender_cache = {}
+        self._handlers = {}
+    
+    def stamp_tick(self):
+        """
+        Capture the clock once per cycle; every message in the cycle reuses it.
+        """
+        self._tick = datetime.now()
+        self._tick_ts = self._tick.strftime("%Y-%m-%d %H:%M:%S")
+    
+    def resolve_sender(self, jid):
+        """
+        Return (short name, full JID string) for a sender, cached per JID.
+        """
+        names = self._sender_cache.get(jid)
+        if names is None:
+            full = str(jid)
+            names = self._sender_cache[jid] = (full.split("@")[0], full)
+        return names
+    
+    async def handle_incoming_message(self, msg):
+        """
+        Parse an incoming ACL message and hand it to the handler for its performative.
+        """
+        performative = sys.intern(msg.metadata.get("performative", "unknown"))
+        sender, sender_jid = self.resolve_sender(msg.sender)
+        
+        self.log_message("RECEIVED", msg, sender)
+        
+        # Parse message body
+        try:
+            content = _loads(msg.body)
+        except _DecodeError:
+            content = {"text": msg.body}
+        
+        # Handle based on performative
+        handler = self._handlers.get(performative)
+        if handler:
+            await handler(sender, content, sender_jid)
+    
+    def log_message(self, direction, msg, other_party, agent_name=None):
+        """
+        Queue a log entry for the message (and echo it to the console if enabled).
+        """
+        timestamp = self._tick_ts
+        performative = msg.metadata.get("performative", "unknown")
+        agent_name = agent_name or self.log_agent
+        agent_line = f"Agent: {agent_name}\n" if agent_name else ""
+        
+        log_entry = f"""[{timestamp}] {direction} - {performative.upper()}
+{_SUBSEP}
+{agent_line}From/To: {other_party}
+Performative: {performative}
+Content: {msg.body}
+"""
+        
+        if self.echo_log:
+            _emit(f"\n{_SEP}\n{log_entry}{_SEP}\n")
+        self.log_queue.put_nowait((_LOG_HEAD, log_entry.encode(), _LOG_TAIL))
 
 
 # COORDINATOR AGENT
@@ -27,146 +317,151 @@ class CoordinatorAgent(Agent):
     Sends REQUESTS to field agents and receives INFORM messages.
     """
     
-    class CommunicationBehaviour(CyclicBehaviour):
-        def __init__(self, log_file):
-            super().__init__()
-            self.log_file = log_file
+    class CommunicationBehaviour(ACLBehaviour):
+        echo_log = True
+        
+        def __init__(self, log_queue, field_agents):
+            super().__init__(log_queue)
+            self.field_agents = field_agents
             self.message_count = 0
             self.active_missions = []
+            self._dispatch_body = {
+                "request": "deploy_rescue_team",
+                "location": None,
+                "priority": "high",
+                "timestamp": None
+            }
+            self._next_status_request = 0.0
+            self._status_baselines = {}  # Last full status per sender (with its seq), for rehydrating deltas
+            self._handlers = {
+                Performative.INFORM: self.handle_inform,
+                Performative.REQUEST: self.handle_request,
+                Performative.AGREE: self.handle_agree
+            }
         
         async def run(self):
-            # Check for incoming messages
-            msg = await self.receive(timeout=2)
+            # Sleep on the mailbox until a message arrives or the next poll is due
+            loop = asyncio.get_running_loop()
+            msg = await self.receive(timeout=max(0.0, self._next_status_request - loop.time()))
+            self.stamp_tick()
             
             if msg:
                 self.message_count += 1
                 await self.handle_incoming_message(msg)
-            else:
-                # Periodically send requests to field agents
-                if self.message_count % 3 == 0:
-                    await self.send_status_request()
             
-            await asyncio.sleep(2)
+            # Periodically send requests to field agents
+            now = loop.time()
+            if now >= self._next_status_request:
+                await self.send_status_request()
+                self._next_status_request = now + STATUS_REQUEST_INTERVAL
         
         async def handle_incoming_message(self, msg):
             """
             Parse incoming ACL messages and trigger appropriate actions.
             """
-            performative = msg.metadata.get("performative", "unknown")
-            sender = str(msg.sender).split("@")[0]
-            
-            self.log_message("RECEIVED", msg, sender)
-            
-            # Parse message body
-            try:
-                content = json.loads(msg.body)
-            except:
-                content = {"text": msg.body}
-            
-            # Handle based on performative
-            if performative == Performative.INFORM:
-                await self.handle_inform(sender, content)
-            
-            elif performative == Performative.REQUEST:
-                await self.handle_request(sender, content)
-            
-            elif performative == Performative.AGREE:
-                await self.handle_agree(sender, content)
-            
-            print()  # Blank line for readability
+            await super().handle_incoming_message(msg)
+            _emit()  # Blank line for readability
+        
+        async def handle_inform(self, sender, content, reply_to):
+            """
+            Handle INFORM messages, which carry one event or a batch under "events".
+            """
+            for event in content.get("events") or (content,):
+                await self.handle_inform_event(sender, event)
         
-        async def handle_inform(self, sender, content):
+        async def handle_inform_event(self, sender, content):
             """
-            Handle INFORM messages (status updates, reports).
+            Handle a single INFORM event (status update, disaster report).
             """
-            print(f"[COORDINATOR] Received status from {sender}:")
-            print(f"  Status: {content.get('status', 'unknown')}")
+            if "delta" in content:
+                baseline = self._status_baselines.get(sender)
+                if baseline is None:
+                    _emit(f"[COORDINATOR] Status delta from {sender} ignored: no baseline yet")
+                    return
+                
+                # A delta only applies on top of the update right before it; after a lost
+                # or reordered update, wait for the next full status instead of merging
+                expected = baseline["seq"] + 1
+                if content.get("seq") != expected:
+                    _emit(f"[COORDINATOR] Status delta from {sender} dropped: "
+                          f"seq {content.get('seq')}, expected {expected}")
+                    return
+                
+                baseline.update(content["delta"])
+                baseline["seq"] = expected
+                content = baseline
+            elif "seq" in content:
+                self._status_baselines[sender] = content
+            
+            _emit(f"[COORDINATOR] Received status from {content.get('agent', sender)}:")
+            _emit(f"  Status: {content.get('status', 'unknown')}")
             
             if 'disaster_detected' in content:
-                print(f"  ⚠️  Disaster Alert: {content['disaster_detected']}")
+                _emit(f"  ⚠️  Disaster Alert: {content['disaster_detected']}")
                 # Trigger response action
                 await self.dispatch_rescue_team(content.get('location', 'unknown'))
         
-        async def handle_request(self, sender, content):
+        async def handle_request(self, sender, content, reply_to):
             """
             Handle REQUEST messages (assistance needed).
             """
-            print(f"[COORDINATOR] Request from {sender}:")
-            print(f"  Request: {content.get('request', 'unknown')}")
+            _emit(f"[COORDINATOR] Request from {sender}:")
+            _emit(f"  Request: {content.get('request', 'unknown')}")
             
             # Send AGREE response
-            response = Message(to=str(sender) + "@404.city")
+            response = Message(to=reply_to)
             response.set_metadata("performative", Performative.AGREE)
-            response.body = json.dumps({
+            response.body = _dumps({
                 "agreed_action": content.get('request'),
-                "timestamp": datetime.now().strftime("%H:%M:%S")
+                "timestamp": self._tick
             })
             
             await self.send(response)
             self.log_message("SENT", response, sender)
         
-        async def handle_agree(self, sender, content):
+        async def handle_agree(self, sender, content, reply_to):
             """
             Handle AGREE messages (agent agrees to perform action).
             """
-            print(f"[COORDINATOR] {sender} agreed to: {content.get('agreed_action')}")
+            _emit(f"[COORDINATOR] {content.get('agent', sender)} agreed to: {content.get('agreed_action')}")
         
         async def send_status_request(self):
             """
             Send REQUEST messages to all field agents for status updates.
             """
-            field_agents = ["fieldagent1", "fieldagent2"]
+            body = _STATUS_REQUEST_PREFIX + self._tick.isoformat() + _JSON_STRING_END
             
-            for agent_name in field_agents:
+            outgoing = []
+            for agent_name in self.field_agents:
                 msg = Message(to=f"{agent_name}@404.city")
                 msg.set_metadata("performative", Performative.REQUEST)
-                msg.body = json.dumps({
-                    "request": "status_update",
-                    "timestamp": datetime.now().strftime("%H:%M:%S")
-                })
-                
-                await self.send(msg)
+                msg.body = body
+                outgoing.append((msg, agent_name))
+            
+            # Issue all sends concurrently instead of one round-trip at a time
+            await asyncio.gather(*(self.send(msg) for msg, _ in outgoing))
+            for msg, agent_name in outgoing:
                 self.log_message("SENT", msg, agent_name)
         
         async def dispatch_rescue_team(self, location):
             """
             Send rescue dispatch request to field agents.
             """
+            body = self._dispatch_body
+            body["location"] = location
+            body["timestamp"] = self._tick
+            
             msg = Message(to="fieldagent1@404.city")
             msg.set_metadata("performative", Performative.REQUEST)
-            msg.body = json.dumps({
-                "request": "deploy_rescue_team",
-                "location": location,
-                "priority": "high",
-                "timestamp": datetime.now().strftime("%H:%M:%S")
-            })
+            msg.body = _dumps(body)
             
             await self.send(msg)
             self.log_message("SENT", msg, "fieldagent1")
-        
-        def log_message(self, direction, msg, other_party):
-            """
-            Log all messages to file and console.
-            """
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            performative = msg.metadata.get("performative", "unknown")
-            
-            log_entry = f"\n{'='*70}\n"
-            log_entry += f"[{timestamp}] {direction} - {performative.upper()}\n"
-            log_entry += f"{'-'*70}\n"
-            log_entry += f"From/To: {other_party}\n"
-            log_entry += f"Performative: {performative}\n"
-            log_entry += f"Content: {msg.body}\n"
-            log_entry += f"{'='*70}\n"
-            
-            print(log_entry)
-            
-            with open(self.log_file, "a") as f:
-                f.write(log_entry)
     
-    def __init__(self, jid, password, log_file, verify_security=False):
+    def __init__(self, jid, password, log_file, verify_security=False, field_agents=FIELD_AGENTS):
         super().__init__(jid, password, verify_security=verify_security)
         self.log_file = log_file
+        self.field_agents = list(field_agents)
     
     async def setup(self):
         print(f"\n[SETUP] CoordinatorAgent {self.jid} starting...")
@@ -178,7 +473,12 @@ class CoordinatorAgent(Agent):
             f.write(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write("="*70 + "\n\n")
         
-        comm_behaviour = self.CommunicationBehaviour(log_file=self.log_file)
+        log_queue = _start_logging(self, self.log_file)
+        
+        comm_behaviour = self.CommunicationBehaviour(
+            log_queue=log_queue,
+            field_agents=self.field_agents
+        )
         self.add_behaviour(comm_behaviour)
         
         print("[SETUP] Communication behaviour active\n")
@@ -194,149 +494,352 @@ class FieldAgent(Agent):
     Sends INFORM messages and responds to REQUESTS.
     """
     
-    class CommunicationBehaviour(CyclicBehaviour):
-        def __init__(self, log_file, agent_name):
-            super().__init__()
-            self.log_file = log_file
+    class CommunicationBehaviour(ACLBehaviour):
+        def __init__(self, log_queue, agent_name):
+            super().__init__(log_queue)
             self.agent_name = agent_name
+            self.log_agent = agent_name
             self.cycle_count = 0
+            self._handlers = {
+                Performative.REQUEST: self.handle_request
+            }
+            self._next_status = 0.0
+            self._next_report = 0.0
+            
+            # Message bodies are built once; only the volatile fields change per send
+            self._status_prefix = _dumps({
+                "status": "operational",
+                "agent": self.agent_name,
+                "resources": "available"
+            })[:-1] + ',"location":"'
+            self._disaster_body = {
+                "status": "alert",
+                "agent": self.agent_name,
+                "disaster_detected": None,
+                "severity": "high",
+                "location": None,
+                "timestamp": None
+            }
+            
+            # Delta encoding state: last volatile fields sent and the update sequence number
+            self._last_status = None
+            self._status_seq = 0
+            
+            # Encoded INFORM events waiting to go out together at the end of the cycle
+            self._pending_events = []
+            self._status_queued = False  # A status event is already among them
+        
+        async def on_start(self):
+            now = asyncio.get_running_loop().time()
+            self._next_status = now + STATUS_INFORM_INTERVAL
+            self._next_report = now + DISASTER_REPORT_INTERVAL
         
         async def run(self):
             self.cycle_count += 1
             
-            # Check for incoming messages
-            msg = await self.receive(timeout=2)
+            # Sleep on the mailbox until a message arrives or scheduled work is due
+            loop = asyncio.get_running_loop()
+            next_due = min(self._next_status, self._next_report)
+            msg = await self.receive(timeout=max(0.0, next_due - loop.time()))
+            self.stamp_tick()
             
             if msg:
                 await self.handle_incoming_message(msg)
             
+            # Scheduled work runs on the loop clock, independent of message traffic
+            now = loop.time()
+            
             # Periodically send status updates
-            if self.cycle_count % 4 == 0:
-                await self.send_status_inform()
+            if now >= self._next_status:
+                self.queue_status_inform()
+                self._next_status = now + STATUS_INFORM_INTERVAL
             
             # Randomly detect disasters
-            if self.cycle_count % 5 == 0:
-                await self.report_disaster()
+            if now >= self._next_report:
+                self.queue_disaster_report()
+                self._next_report = now + DISASTER_REPORT_INTERVAL
             
-            await asyncio.sleep(2)
+            # Everything produced this cycle leaves as a single INFORM
+            await self.send_pending_events()
         
-        async def handle_incoming_message(self, msg):
+        async def handle_request(self, sender, content, reply_to):
             """
-            Parse and respond to incoming ACL messages.
+            Handle REQUEST messages (status updates, rescue deployments).
             """
-            performative = msg.metadata.get("performative", "unknown")
-            sender = str(msg.sender).split("@")[0]
+            request_type = content.get("request")
             
-            self.log_message("RECEIVED", msg, sender)
+            if request_type == "status_update":
+                # Respond with INFORM (sent with the rest of this cycle's events)
+                self.queue_status_inform()
             
-            try:
-                content = json.loads(msg.body)
-            except:
-                content = {"text": msg.body}
-            
-            # Handle REQUEST performatives
-            if performative == Performative.REQUEST:
-                request_type = content.get("request")
+            elif request_type == "deploy_rescue_team":
+                # Respond with AGREE
+                response = Message(to=reply_to)
+                response.set_metadata("performative", Performative.AGREE)
+                response.body = _dumps({
+                    "agreed_action": "deploy_rescue_team",
+                    "location": content.get("location"),
+                    "eta": "5 minutes",
+                    "timestamp": self._tick
+                })
                 
-                if request_type == "status_update":
-                    # Respond with INFORM
-                    await self.send_status_inform()
+                await self.send(response)
+                self.log_message("SENT", response, sender)
                 
-                elif request_type == "deploy_rescue_team":
-                    # Respond with AGREE
-                    response = Message(to=str(msg.sender))
-                    response.set_metadata("performative", Performative.AGREE)
-                    response.body = json.dumps({
-                        "agreed_action": "deploy_rescue_team",
-                        "location": content.get("location"),
-                        "eta": "5 minutes",
-                        "timestamp": datetime.now().strftime("%H:%M:%S")
-                    })
-                    
-                    await self.send(response)
-                    self.log_message("SENT", response, sender)
-                    
-                    print(f"[{self.agent_name.upper()}] Deploying rescue team to {content.get('location')}\n")
-        
-        async def send_status_inform(self):
+                _emit(f"[{self.agent_name.upper()}] Deploying rescue team to {content.get('location')}\n")
+        
+        def queue_status_inform(self):
             """
-            Send INFORM message with current status.
+            Queue a status event for the next INFORM (at most one per cycle).
             """
-            msg = Message(to="coordinator@404.city")
+            if self._status_queued:
+                return
+            self._status_queued = True
+            self._status_seq += 1
+            seq = self._status_seq
+            
+            # Static fields never change after __init__, so only these can differ
+            status = {
+                "location": ZONES[self.cycle_count % len(ZONES)],
+                "timestamp": self._tick.isoformat()
+            }
+            body = (
+                self._status_prefix + status["location"]
+                + '","timestamp":"' + status["timestamp"] + f'","seq":{seq}}}'
+            )
+            
+            # Send only the changed fields when the coordinator holds a recent baseline
+            last = self._last_status
+            if last is not None and seq % STATUS_BASELINE_EVERY != 0:
+                delta = {key: value for key, value in status.items() if last.get(key) != value}
+                delta_body = _dumps({"delta": delta, "seq": seq})
+                if len(delta_body) < len(body):
+                    body = delta_body
+            self._last_status = status
+            self._pending_events.append(body)
+        
+        def queue_disaster_report(self):
+            """
+            Queue a detected disaster event for the next INFORM.
+            """
+            disaster_type = DISASTER_TYPES[self.cycle_count % len(DISASTER_TYPES)]
+            
+            body = self._disaster_body
+            body["disaster_detected"] = disaster_type
+            body["location"] = ZONES[self.cycle_count % len(ZONES)]
+            body["timestamp"] = self._tick
+            self._pending_events.append(_dumps(body))
+            
+            _emit(f"[{self.agent_name.upper()}] ⚠️  Detected {disaster_type}!\n")
+        
+        async def send_pending_events(self):
+            """
+            Send all queued events to the coordinator as one INFORM message.
+            """
+            if not self._pending_events:
+                return
+            
+            msg = Message(to=COORDINATOR_JID)
             msg.set_metadata("performative", Performative.INFORM)
-            msg.body = json.dumps({
-                "status": "operational",
-                "agent": self.agent_name,
-                "location": f"Zone-{self.cycle_count % 10}",
-                "resources": "available",
-                "timestamp": datetime.now().strftime("%H:%M:%S")
-            })
+            msg.body = _inform_body(self._pending_events)
+            self._pending_events = []
+            self._status_queued = False
             
             await self.send(msg)
             self.log_message("SENT", msg, "coordinator")
+    
+    def __init__(self, jid, password, log_file, agent_name, verify_security=False):
+        super().__init__(jid, password, verify_security=verify_security)
+        self.log_file = log_file
+        self.agent_name = agent_name
+    
+    async def setup(self):
+        print(f"[SETUP] {self.agent_name} {self.jid} starting...")
+        
+        log_queue = _start_logging(self, self.log_file)
         
-        async def report_disaster(self):
+        comm_behaviour = self.CommunicationBehaviour(
+            log_queue=log_queue,
+            agent_name=self.agent_name
+        )
+        self.add_behaviour(comm_behaviour)
+        
+        print(f"[SETUP] {self.agent_name} communication active\n")
+
+
+# ============================================================================
+# FIELD AGENT POOL
+# ============================================================================
+
+class FieldAgentPool(Agent):
+    """
+    A single agent simulating many field agents for scale-out experiments.
+    Per-agent state is kept as parallel lists indexed by agent id, and one
+    behaviour serves every simulated agent instead of one spade Agent each.
+    """
+    
+    class CommunicationBehaviour(ACLBehaviour):
+        log_agent = "pool"
+        
+        def __init__(self, log_queue, agent_names):
+            super().__init__(log_queue)
+            self._handlers = {
+                Performative.REQUEST: self.handle_request
+            }
+            
+            # Structure of arrays: one entry per simulated field agent
+            self.names = list(agent_names)
+            self.cycles = [0] * len(self.names)
+            self.next_status = [0.0] * len(self.names)
+            self.next_report = [0.0] * len(self.names)
+            self.status_prefixes = [
+                _dumps({
+                    "status": "operational",
+                    "agent": name,
+                    "resources": "available"
+                })[:-1] + ',"location":"'
+                for name in self.names
+            ]
+            
+            # Encoded INFORM events waiting to go out together at the end of the cycle
+            self._pending_events = []
+            self._status_queued = False  # A status request already queued every agent's status
+        
+        async def on_start(self):
+            now = asyncio.get_running_loop().time()
+            self.next_status = [now + STATUS_INFORM_INTERVAL] * len(self.names)
+            self.next_report = [now + DISASTER_REPORT_INTERVAL] * len(self.names)
+        
+        async def run(self):
+            # Sleep on the mailbox until a message arrives or any agent has work due
+            loop = asyncio.get_running_loop()
+            next_due = min(min(self.next_status), min(self.next_report))
+            msg = await self.receive(timeout=max(0.0, next_due - loop.time()))
+            self.stamp_tick()
+            
+            if msg:
+                await self.handle_incoming_message(msg)
+            
+            now = loop.time()
+            due_status = [i for i, due in enumerate(self.next_status) if now >= due]
+            due_report = [i for i, due in enumerate(self.next_report) if now >= due]
+            
+            if not self._status_queued:
+                self._pending_events += [self.build_status_inform(i) for i in due_status]
+            self._pending_events += [self.build_disaster_report(i) for i in due_report]
+            for i in due_status:
+                self.next_status[i] = now + STATUS_INFORM_INTERVAL
+            for i in due_report:
+                self.next_report[i] = now + DISASTER_REPORT_INTERVAL
+            
+            # Everything produced this cycle leaves as a single INFORM
+            await self.send_pending_events()
+        
+        async def handle_request(self, sender, content, reply_to):
             """
-            Send INFORM message about detected disaster.
+            Handle REQUEST messages; status requests are answered by every simulated agent.
             """
-            disasters = ["Fire", "Flood", "Earthquake", "Building Collapse"]
-            disaster_type = disasters[self.cycle_count % len(disasters)]
+            request_type = content.get("request")
             
-            msg = Message(to="coordinator@404.city")
-            msg.set_metadata("performative", Performative.INFORM)
-            msg.body = json.dumps({
+            if request_type == "status_update":
+                # Respond with INFORM (sent with the rest of this cycle's events)
+                if not self._status_queued:
+                    self._status_queued = True
+                    self._pending_events += [self.build_status_inform(i) for i in range(len(self.names))]
+            
+            elif request_type == "deploy_rescue_team":
+                # Respond with AGREE; the first agent in the pool takes the mission
+                name = self.names[0]
+                response = Message(to=reply_to)
+                response.set_metadata("performative", Performative.AGREE)
+                response.body = _dumps({
+                    "agreed_action": "deploy_rescue_team",
+                    "agent": name,
+                    "location": content.get("location"),
+                    "eta": "5 minutes",
+                    "timestamp": self._tick
+                })
+                
+                await self.send(response)
+                self.log_message("SENT", response, sender, name)
+                
+                _emit(f"[{name.upper()}] Deploying rescue team to {content.get('location')}\n")
+        
+        def build_status_inform(self, i):
+            """
+            Encode the full status event for agent i (no delta encoding: the
+            coordinator keys baselines by sender, which the whole pool shares).
+            """
+            self.cycles[i] += 1
+            
+            return (
+                self.status_prefixes[i] + ZONES[self.cycles[i] % len(ZONES)]
+                + '","timestamp":"' + self._tick.isoformat() + _JSON_STRING_END
+            )
+        
+        def build_disaster_report(self, i):
+            """
+            Encode the disaster event for agent i.
+            """
+            self.cycles[i] += 1
+            disaster_type = DISASTER_TYPES[self.cycles[i] % len(DISASTER_TYPES)]
+            
+            event = _dumps({
                 "status": "alert",
+                "agent": self.names[i],
                 "disaster_detected": disaster_type,
                 "severity": "high",
-                "location": f"Zone-{self.cycle_count % 10}",
-                "timestamp": datetime.now().strftime("%H:%M:%S")
+                "location": ZONES[self.cycles[i] % len(ZONES)],
+                "timestamp": self._tick
             })
             
-            await self.send(msg)
-            self.log_message("SENT", msg, "coordinator")
-            
-            print(f"[{self.agent_name.upper()}] ⚠️  Detected {disaster_type}!\n")
+            _emit(f"[{self.names[i].upper()}] ⚠️  Detected {disaster_type}!\n")
+            return event
         
-        def log_message(self, direction, msg, other_party):
+        async def send_pending_events(self):
             """
-            Log messages to file.
+            Send the queued events of every agent to the coordinator as one INFORM message.
             """
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            performative = msg.metadata.get("performative", "unknown")
-            
-            log_entry = f"\n{'='*70}\n"
-            log_entry += f"[{timestamp}] {direction} - {performative.upper()}\n"
-            log_entry += f"{'-'*70}\n"
-            log_entry += f"Agent: {self.agent_name}\n"
-            log_entry += f"From/To: {other_party}\n"
-            log_entry += f"Performative: {performative}\n"
-            log_entry += f"Content: {msg.body}\n"
-            log_entry += f"{'='*70}\n"
-            
-            with open(self.log_file, "a") as f:
-                f.write(log_entry)
+            if not self._pending_events:
+                return
+            
+            msg = Message(to=COORDINATOR_JID)
+            msg.set_metadata("performative", Performative.INFORM)
+            msg.body = _inform_body(self._pending_events)
+            self._pending_events = []
+            self._status_queued = False
+            
+            await self.send(msg)
+            self.log_message("SENT", msg, "coordinator")
     
-    def __init__(self, jid, password, log_file, agent_name, verify_security=False):
+    def __init__(self, jid, password, log_file, agent_names, verify_security=False):
+        if not agent_names:
+            raise ValueError("FieldAgentPool needs at least one agent name")
         super().__init__(jid, password, verify_security=verify_security)
         self.log_file = log_file
-        self.agent_name = agent_name
+        self.agent_names = agent_names
     
     async def setup(self):
-        print(f"[SETUP] {self.agent_name} {self.jid} starting...")
+        print(f"[SETUP] FieldAgentPool {self.jid} starting with {len(self.agent_names)} agents...")
+        
+        log_queue = _start_logging(self, self.log_file)
         
         comm_behaviour = self.CommunicationBehaviour(
-            log_file=self.log_file,
-            agent_name=self.agent_name
+            log_queue=log_queue,
+            agent_names=self.agent_names
         )
         self.add_behaviour(comm_behaviour)
         
-        print(f"[SETUP] {self.agent_name} communication active\n")
+        print("[SETUP] FieldAgentPool communication active\n")
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
+# Simulated field agents run by a FieldAgentPool; set FIELD_POOL_SIZE in the environment (0 disables it)
+FIELD_POOL_SIZE = int(os.environ.get("FIELD_POOL_SIZE", "0"))
+
 async def main():
     """
     Main function to run multi-agent communication system.
@@ -352,11 +855,16 @@ async def main():
     field_log = "field_agent_messages.log"
     
     # Create agents
+    field_agents = list(FIELD_AGENTS)
+    if FIELD_POOL_SIZE:
+        field_agents.append(FIELD_POOL_NAME)
+    
     coordinator = CoordinatorAgent(
-        jid="coordinator@404.city",
+        jid=COORDINATOR_JID,
         password="coord123",
         log_file=coordinator_log,
-        verify_security=False
+        verify_security=False,
+        field_agents=field_agents
     )
     
     field_agent1 = FieldAgent(
@@ -375,10 +883,23 @@ async def main():
         verify_security=False
     )
     
+    # Optional scale-out experiment: one agent driving many simulated field agents
+    field_pool = None
+    if FIELD_POOL_SIZE:
+        field_pool = FieldAgentPool(
+            jid=f"{FIELD_POOL_NAME}@404.city",
+            password="field123",
+            log_file=field_log,
+            agent_names=[f"PoolAgent{i + 1}" for i in range(FIELD_POOL_SIZE)],
+            verify_security=False
+        )
+    
     # Start all agents
     await coordinator.start()
     await field_agent1.start()
     await field_agent2.start()
+    if field_pool is not None:
+        await field_pool.start()
     
     print("[INFO] All agents started. Communication in progress...\n")
     print("="*70)
@@ -392,9 +913,17 @@ async def main():
         print("\n[INFO] Stopping agents...")
     
     # Stop all agents
-    await coordinator.stop()
-    await field_agent1.stop()
-    await field_agent2.stop()
+    agents = [coordinator, field_agent1, field_agent2]
+    if field_pool is not None:
+        agents.append(field_pool)
+    
+    for agent in agents:
+        await agent.stop()
+    
+    # Log writers finish once the other behaviours have ended; wait so nothing is lost
+    for agent in agents:
+        await agent.log_writer.join()
+    _flush_output()
     
     print("\n" + "="*70)
     print("COMMUNICATION SESSION COMPLETED")